@@ -1,14 +1,6 @@
 """Set up module access for the base package."""
 
-from . import stationary_energy
-from . import ippu
-from . import transportation
-from . import waste
-from . import afolu
-from . import constants
-from . import efdb
-
-from .activity_based import general_formula
+import importlib
 
 __all__ = [
     "stationary_energy",
@@ -19,4 +11,36 @@ __all__ = [
     "afolu",
     "constants",
     "general_formula",
+    "general_formula_batch",
 ]
+
+_SUBMODULES = {
+    "stationary_energy",
+    "efdb",
+    "ippu",
+    "transportation",
+    "waste",
+    "afolu",
+    "constants",
+}
+
+
+def __getattr__(name):
+    """Import submodules lazily (PEP 562) so `import abemis` stays cheap."""
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+
+    if name in ("general_formula", "general_formula_batch"):
+        from . import activity_based
+
+        func = getattr(activity_based, name)
+        globals()[name] = func
+        return func
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(__all__)
@@ -2,10 +2,9 @@
 
 import numpy as np
 
-from .utils import convert_to_numpy
+from ._kernels import sum_product
 
 
-@convert_to_numpy
 def general_formula(a, ef, c=0, r=0):
     r"""General activity-based emissions equation.
 
@@ -31,4 +30,45 @@ def general_formula(a, ef, c=0, r=0):
     float
         emissions
     """  # noqa: E501
-    return np.sum(a * ef) * c - r
+    if np.ndim(c) == 0 and c == 0:
+        # with c=0 (the default) the whole activity term is zero,
+        # so skip the product and reduction entirely
+        return -r
+
+    if isinstance(a, (int, float)) and isinstance(ef, (int, float)):
+        # scalar fast path: no array coercion or ufunc dispatch
+        return a * ef * c - r
+
+    return sum_product(a, ef) * c - r
+
+
+def general_formula_batch(a, ef, c=1.0, r=0.0):
+    r"""General activity-based emissions equation for a batch of inventories.
+
+    .. math::
+
+        E_k = \sum_i (A_{k,i} \cdot EF_{k,i}) \cdot C - R
+
+    where k indexes the inventory (e.g. a city or sector) and i the category.
+    Equivalent to calling :func:`general_formula` once per row of `a`/`ef`,
+    but the reduction runs as a single fused einsum over the whole block.
+
+    Parameters
+    ----------
+    a : array_like
+        activity, shape (K, N)
+    ef : array_like
+        emission factor, shape (K, N)
+    c : float, optional
+        conversion, by default 1.0
+    r : float, optional
+        removal, by default 0.0
+
+    Returns
+    -------
+    np.ndarray
+        emissions, shape (K,)
+    """  # noqa: E501
+    a = np.ascontiguousarray(a)
+    ef = np.ascontiguousarray(ef)
+    return np.einsum("kn,kn->k", a, ef) * c - r
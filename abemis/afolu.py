@@ -2,11 +2,31 @@
 
 import numpy as np
 
+from ._kernels import sum_prod3
 from .utils import convert_to_numpy
-from .constants import Conversions
+from .constants import (
+    C_TO_CO2,
+    G_TO_KG,
+    KG_TO_GG,
+    KG_TO_TONNE,
+    N_TO_N2O,
+    YEAR_TO_DAYS,
+    Conversions,
+)
 
 constants = Conversions()
 
+# flat conversion factors bound once at import; see constants.py
+_KG_TO_TONNE = KG_TO_TONNE
+_G_TO_KG = G_TO_KG
+_N_TO_N2O = N_TO_N2O
+_C_TO_CO2 = C_TO_CO2
+_DAYS_IN_YEAR = YEAR_TO_DAYS
+_KG_TO_GG = KG_TO_GG
+
+# compound factor shared by the manure-management N2O equations
+_N2O_MMS_FACTOR = _N_TO_N2O * _KG_TO_TONNE
+
 
 @convert_to_numpy
 def enteric_fermentation_ch4(N, EF):
@@ -37,8 +57,7 @@ def enteric_fermentation_ch4(N, EF):
 
     .. [2] `2006 IPCC Guidelines for National Greenhouse Gas Inventories, Chapter 10: Emissions from livestock and manure management <https://www.ipcc-nggip.iges.or.jp/public/2006gl/pdf/4_Volume4/V4_10_Ch10_Livestock.pdf#page=28>`_
     """  # noqa: E501
-    kg_to_tonnes = constants.kg_to_tonne.value
-    return N * EF * kg_to_tonnes
+    return N * EF * _KG_TO_TONNE
 
 
 @convert_to_numpy
@@ -71,8 +90,7 @@ def manure_management_ch4(N, EF):
 
     .. [2] `2006 IPCC Guidelines for National Greenhouse Gas Inventories, Chapter 10: Emissions from livestock and manure management <https://www.ipcc-nggip.iges.or.jp/public/2006gl/pdf/4_Volume4/V4_10_Ch10_Livestock.pdf#page=37>`_
     """  # noqa: E501
-    kg_to_tonnes = constants.kg_to_tonne.value
-    return N * EF * kg_to_tonnes
+    return N * EF * _KG_TO_TONNE
 
 
 @convert_to_numpy
@@ -112,10 +130,7 @@ def manure_management_n2o(N, NEX, MS, EF):
 
     .. [2] `2006 IPCC Guidelines for National Greenhouse Gas Inventories, Chapter 10: Emissions from livestock and manure management <https://www.ipcc-nggip.iges.or.jp/public/2006gl/pdf/4_Volume4/V4_10_Ch10_Livestock.pdf#page=54>`_
     """  # noqa: E501
-    N_to_N2O = constants.N_to_N2O.value
-    kg_to_tonnes = constants.kg_to_tonne.value
-
-    return (N * NEX * MS) * EF * N_to_N2O * kg_to_tonnes
+    return N * NEX * MS * EF * _N2O_MMS_FACTOR
 
 
 @convert_to_numpy
@@ -148,9 +163,7 @@ def nex(N, TAM):
 
     .. [2] `2006 IPCC Guidelines for National Greenhouse Gas Inventories, Chapter 10: Emissions from livestock and manure management <https://www.ipcc-nggip.iges.or.jp/public/2006gl/pdf/4_Volume4/V4_10_Ch10_Livestock.pdf#page=57>`_
     """  # noqa: E501
-    kg_to_tonne = constants.kg_to_tonne.value
-    days_in_year = constants.year_to_days.value
-    return N * TAM * kg_to_tonne * days_in_year
+    return N * TAM * _KG_TO_TONNE * _DAYS_IN_YEAR
 
 
 @convert_to_numpy
@@ -199,9 +212,8 @@ def delta_c(FL, CL, GL, WL, SL, OL):
     .. [2] `2019 Refinement to the 2006 IPCC Guidelines for National Greenhouse Gas Inventories, Chapter 2: generic methodologies applicable to multiple land-use categories
         <https://www.ipcc-nggip.iges.or.jp/public/2019rf/pdf/4_Volume4/19R_V4_Ch02_Generic%20Methods.pdf#page=7>`_
     """  # noqa: E501
-    C_to_CO2 = constants.C_to_CO2.value
-    AFOLU = FL + CL + GL + WL + SL + OL
-    return AFOLU * C_to_CO2
+    AFOLU = np.add.reduce(np.broadcast_arrays(FL, CL, GL, WL, SL, OL), axis=0)
+    return AFOLU * _C_TO_CO2
 
 
 @convert_to_numpy
@@ -246,10 +258,8 @@ def biomass_burning(A, B, CF, EF):
     * GPC [1]_ states this is GHG emissions in CO2-equivalent units and the IPCC [2]_ uses
      a different emission factor for each gas. We suggest following the IPCC
     """  # noqa: E501
-    # TODO: put this in constants
-    # this this converts EF so units are in tonnes in end
-    g_to_kg = constants.g_to_kg.value
-    return A * B * CF * EF * g_to_kg
+    # this converts EF so units are in tonnes in the end
+    return A * B * CF * EF * _G_TO_KG
 
 
 @convert_to_numpy
@@ -283,8 +293,7 @@ def liming(M, EF):
     .. [2] `2006 IPCC Guidelines for National Greenhouse Gas Inventories, Chapter 11: N2O emissions from managed soils, and CO2 emissions from lime and urea application
         <https://www.ipcc-nggip.iges.or.jp/public/2006gl/pdf/4_Volume4/V4_11_Ch11_N2O&CO2.pdf#page=27>`_
     """  # noqa: E501
-    C_to_CO2 = constants.C_to_CO2.value
-    return M * EF * C_to_CO2
+    return M * EF * _C_TO_CO2
 
 
 @convert_to_numpy
@@ -317,8 +326,7 @@ def urea_fertilization(M, EF):
     .. [2] `2006 IPCC Guidelines for National Greenhouse Gas Inventories, Chapter 11: N2O emissions from managed soils, and CO2 emissions from lime and urea application
         <https://www.ipcc-nggip.iges.or.jp/public/2006gl/pdf/4_Volume4/V4_11_Ch11_N2O&CO2.pdf#page=32>`_
     """  # noqa: E501
-    C_to_CO2 = constants.C_to_CO2.value
-    return M * EF * C_to_CO2
+    return M * EF * _C_TO_CO2
 
 
 @convert_to_numpy
@@ -353,10 +361,12 @@ def manure_management_n2o_indirect(n, nex, ms, frac, ef):
     """  # noqa: E501
     # Nv: Amount of manure nitrogen that is lost due to volatilization of NH3 and NOx,
     # units: kg N per year.
-    Nv = np.sum(n * nex * ms) * frac
-    kg_to_tonne = constants.kg_to_tonne.value
-    N_to_N2O = constants.N_to_N2O.value
-    return Nv * ef * kg_to_tonne * N_to_N2O
+    if np.ndim(n) == 1 and np.shape(n) == np.shape(nex) == np.shape(ms):
+        # single fused multiply-accumulate pass, no intermediate arrays
+        Nv = sum_prod3(n, nex, ms) * frac
+    else:
+        Nv = np.sum(n * nex * ms) * frac
+    return Nv * ef * _N2O_MMS_FACTOR
 
 
 @convert_to_numpy
@@ -397,8 +407,7 @@ def rice_cultivation_ch4(EF, T, A):
 
     .. [2] `2006 IPCC Guidelines for National Greenhouse Gas Inventories, Chapter 5: Cropland <https://www.ipcc-nggip.iges.or.jp/public/2006gl/pdf/4_Volume4/V4_05_Ch5_Cropland.pdf#page=45>`_
     """  # noqa: E501
-    kg_to_Gg = constants.kg_to_Gg.value
-    return EF * T * A * kg_to_Gg
+    return EF * T * A * _KG_TO_GG
 
 
 def _managed_soils_direct_n2o(inputs, os, prp):
@@ -1,11 +1,16 @@
 """Constants used throughout package."""
 
 from dataclasses import dataclass
+from typing import NamedTuple
 
 
-@dataclass(frozen=True)
-class Constant:
-    """Constants dataclass."""
+class Constant(NamedTuple):
+    """A constant value with its metadata.
+
+    NamedTuple rather than a frozen dataclass: attribute access is a
+    plain tuple-offset load (no instance __dict__), which matters for
+    code still reading `.value` in hot loops.
+    """
 
     value: float
     long_name: str
@@ -60,3 +65,16 @@ class GWP100_AR6:
         long_name="GWP for N2O, including feedbacks",
         units="mass CO2 / mass N2O",
     )
+
+
+# Flat float bindings for numeric code. The dataclasses above remain the
+# metadata-carrying source of truth; these let hot equation bodies bind
+# bare floats instead of walking the Constant attribute chain per call.
+KG_TO_TONNE: float = Conversions.kg_to_tonne.value
+G_TO_TONNE: float = Conversions.g_to_tonne.value
+N_TO_N2O: float = Conversions.N_to_N2O.value
+C_TO_CO2: float = Conversions.C_to_CO2.value
+YEAR_TO_DAYS: float = Conversions.year_to_days.value
+CH4_TO_C: float = Conversions.CH4_to_C.value
+KG_TO_GG: float = Conversions.kg_to_Gg.value
+G_TO_KG: float = Conversions.g_to_kg.value
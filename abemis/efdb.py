@@ -1,7 +1,68 @@
 """Emission factor database."""
 
+import functools
+import threading
+
 import pandas as pd
-from pathlib import Path
+from importlib.resources import files
+
+# resolved once at import; also works when the package is installed
+# somewhere other than the current working directory
+_EFDB_DIR = files("abemis") / "efdb"
+
+
+@functools.lru_cache(maxsize=None)
+def _load(name: str) -> pd.DataFrame:
+    """Read an EFDB table from disk once and cache the parsed DataFrame.
+
+    Parameters
+    ----------
+    name : str
+        short name of the table (e.g. "waste", "ippu", "energy", "afolu")
+
+    Returns
+    -------
+    pd.DataFrame
+        pandas dataframe of emission factors.
+        The returned frame is shared between calls and must not be mutated.
+    """
+    # categorical dtype turns the equality filters below into
+    # integer-code compares instead of full string-column scans
+    df = pd.read_excel(
+        _EFDB_DIR / f"EFDB_{name}.xlsx",
+        engine="openpyxl",
+        dtype={"Region / Regional Conditions": "category"},
+    )
+
+    # the source "Gas" column carries a stray trailing newline and mixed
+    # case; normalize once here so the filters compare clean values
+    df["Gas"] = df["Gas"].astype("string").str.strip().str.upper().astype("category")
+
+    return df
+
+
+@functools.lru_cache(maxsize=None)
+def _region_gas_indices(name: str) -> dict:
+    """Row positions keyed by (region, gas), built once per table.
+
+    Serving the combined region+gas filter from this map is a hash lookup
+    plus a row gather instead of two boolean scans over the table.
+    """
+    groups = _load(name).groupby(
+        ["Region / Regional Conditions", "Gas"], observed=True
+    )
+    return groups.indices
+
+
+@functools.lru_cache(maxsize=None)
+def _description_lower(name: str) -> pd.Series:
+    """Lowercased "Description" column of a table, computed once per table.
+
+    Caching this lets `search` run a case-insensitive plain-substring match
+    (`regex=False`) instead of re-lowercasing and regex-scanning the column
+    on every call.
+    """
+    return _load(name)["Description"].str.lower().fillna("")
 
 
 def waste(region: str = None, gas: str = None, search: str = None, *args, **kwargs):
@@ -21,21 +82,21 @@ def waste(region: str = None, gas: str = None, search: str = None, *args, **kwar
     pd.DataFrame
         pandas dataframe of emission factors
     """
-    script_dir = Path(__file__).parent
-    file_path = script_dir / "efdb" / "EFDB_waste.xlsx"
+    df = _load("waste")
 
-    df = pd.read_excel(file_path)
-
-    if region:
+    if region and gas:
+        rows = _region_gas_indices("waste").get((region, gas.upper()))
+        df = df.iloc[rows] if rows is not None else df.iloc[0:0]
+    elif region:
         df = df.loc[df["Region / Regional Conditions"] == region]
-
-    if gas:
-        df = df.loc[df["Gas"] == gas.upper() + "\n"]
+    elif gas:
+        df = df.loc[df["Gas"] == gas.upper()]
 
     if search:
-        df = df.loc[df["Description"].str.contains(search, na=False)]
+        mask = _description_lower("waste").str.contains(search.lower(), regex=False)
+        df = df.loc[mask]
 
-    return df
+    return df.copy()
 
 
 def ippu(region: str = None, gas: str = None, search: str = None, *args, **kwargs):
@@ -55,21 +116,21 @@ def ippu(region: str = None, gas: str = None, search: str = None, *args, **kwarg
     pd.DataFrame
         pandas dataframe of emission factors
     """
-    script_dir = Path(__file__).parent
-    file_path = script_dir / "efdb" / "EFDB_ippu.xlsx"
-
-    df = pd.read_excel(file_path)
+    df = _load("ippu")
 
-    if region:
+    if region and gas:
+        rows = _region_gas_indices("ippu").get((region, gas.upper()))
+        df = df.iloc[rows] if rows is not None else df.iloc[0:0]
+    elif region:
         df = df.loc[df["Region / Regional Conditions"] == region]
-
-    if gas:
-        df = df.loc[df["Gas"] == gas]
+    elif gas:
+        df = df.loc[df["Gas"] == gas.upper()]
 
     if search:
-        df = df.loc[df["Description"].str.contains(search, na=False)]
+        mask = _description_lower("ippu").str.contains(search.lower(), regex=False)
+        df = df.loc[mask]
 
-    return df
+    return df.copy()
 
 
 def energy(region: str = None, gas: str = None, search: str = None, *args, **kwargs):
@@ -89,21 +150,21 @@ def energy(region: str = None, gas: str = None, search: str = None, *args, **kwa
     pd.DataFrame
         pandas dataframe of emission factors
     """
-    script_dir = Path(__file__).parent
-    file_path = script_dir / "efdb" / "EFDB_energy.xlsx"
-
-    df = pd.read_excel(file_path)
+    df = _load("energy")
 
-    if region:
+    if region and gas:
+        rows = _region_gas_indices("energy").get((region, gas.upper()))
+        df = df.iloc[rows] if rows is not None else df.iloc[0:0]
+    elif region:
         df = df.loc[df["Region / Regional Conditions"] == region]
-
-    if gas:
-        df = df.loc[df["Gas"] == gas]
+    elif gas:
+        df = df.loc[df["Gas"] == gas.upper()]
 
     if search:
-        df = df.loc[df["Description"].str.contains(search, na=False)]
+        mask = _description_lower("energy").str.contains(search.lower(), regex=False)
+        df = df.loc[mask]
 
-    return df
+    return df.copy()
 
 
 def afolu(region: str = None, gas: str = None, search: str = None, *args, **kwargs):
@@ -123,18 +184,31 @@ def afolu(region: str = None, gas: str = None, search: str = None, *args, **kwar
     pd.DataFrame
         pandas dataframe of emission factors
     """
-    script_dir = Path(__file__).parent
-    file_path = script_dir / "efdb" / "EFDB_afolu.xlsx"
-
-    df = pd.read_excel(file_path)
+    df = _load("afolu")
 
-    if region:
+    if region and gas:
+        rows = _region_gas_indices("afolu").get((region, gas.upper()))
+        df = df.iloc[rows] if rows is not None else df.iloc[0:0]
+    elif region:
         df = df.loc[df["Region / Regional Conditions"] == region]
-
-    if gas:
-        df = df.loc[df["Gas"] == gas]
+    elif gas:
+        df = df.loc[df["Gas"] == gas.upper()]
 
     if search:
-        df = df.loc[df["Description"].str.contains(search, na=False)]
+        mask = _description_lower("afolu").str.contains(search.lower(), regex=False)
+        df = df.loc[mask]
 
-    return df
+    return df.copy()
+
+
+def _preload():
+    """Warm the table cache so the first user call does not pay the XLSX parse."""
+    for name in ("waste", "ippu", "energy", "afolu"):
+        _load(name)
+
+
+# Warm the cache in a background thread at import. A caller racing the
+# preload simply parses the table itself (lru_cache keeps one result).
+# The loaded tables are read-only, so forked worker processes share them
+# copy-on-write for free.
+threading.Thread(target=_preload, daemon=True).start()
@@ -1,11 +1,14 @@
 """IPPU equations."""
 
-from .constants import Conversions
+from .constants import C_TO_CO2, Conversions
 
 from .utils import convert_to_numpy
 
 constants = Conversions()
 
+# flat conversion factor bound once at import; see constants.py
+_C_TO_CO2 = C_TO_CO2
+
 
 @convert_to_numpy
 def cement_production(M, EF):
@@ -40,9 +43,7 @@ def cement_production(M, EF):
     return M * EF
 
 
-convert_to_numpy
-
-
+@convert_to_numpy
 def lime_production(M, EF):
     r"""CO2 emissions from lime production.
 
@@ -76,9 +77,7 @@ def lime_production(M, EF):
     return M * EF
 
 
-convert_to_numpy
-
-
+@convert_to_numpy
 def glass_production(M, EF, CR):
     r"""CO2 emissions from glass production.
 
@@ -115,9 +114,7 @@ def glass_production(M, EF, CR):
     return M * EF * (1 - CR)
 
 
-convert_to_numpy
-
-
+@convert_to_numpy
 def non_energy_product_use(NEU, CC, ODU):
     r"""CO2 emissions from non-energy product use.
 
@@ -152,5 +149,4 @@ def non_energy_product_use(NEU, CC, ODU):
     # 2006 IPCC Guidelines for National Greenhouse Gas Inventories
     # Volume 3 Industrial Processes and Product Use available at:
     # www.ipcc-nggip.iges.or.jp/public/2006gl/vol3.html
-    CO2_to_C = constants.C_to_CO2.value
-    return NEU * CC * ODU * CO2_to_C
+    return NEU * CC * ODU * _C_TO_CO2
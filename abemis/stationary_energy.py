@@ -1,7 +1,6 @@
 """stationary energy equations."""
 
-import numpy as np
-
+from ._kernels import sum_product
 from .utils import convert_to_numpy
 
 
@@ -30,4 +29,4 @@ def combustion(a, ef):
     float
         emissions of fuel by type
     """  # noqa: E501
-    return np.sum(a * ef)
+    return sum_product(a, ef)
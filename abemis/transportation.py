@@ -1,11 +1,14 @@
 """Transportation equations."""
 
-import numpy as np
-
+from ._kernels import elementwise, sum_product
 from .utils import convert_to_numpy
 
 
-@convert_to_numpy
+@elementwise("f8(f8,f8,f8,f8)")
+def _asif(a, s, i, f):
+    return a * s * i * f
+
+
 def asif_framework(a: float, s: float, i: float, f: float) -> float:
     r"""ASIF framework for transportation emissions.
 
@@ -45,7 +48,7 @@ def asif_framework(a: float, s: float, i: float, f: float) -> float:
         Transport and Carbon Dioxide Emissions: Forecasts, Options Analysis, and Evaluation. 2009.
         https://www.adb.org/publications/transport-and-carbon-dioxide-emissions-forecasts-options-analysis-and-evaluation
     """  # noqa: E501
-    return a * s * i * f
+    return _asif(a, s, i, f)
 
 
 @convert_to_numpy
@@ -76,4 +79,4 @@ def fuel_sales(quantity: float, ef: float) -> float:
         "Methodology for inventorying greenhouse gas emissions from global cities."
         Energy policy 38.9 (2010): 4828-4837. doi: `10.1016/j.enpol.2009.08.050 <doi.org/10.1016/j.enpol.2009.08.050>`_
     """  # noqa: E501
-    return np.sum(quantity * ef)
+    return sum_product(quantity, ef)
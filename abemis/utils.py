@@ -4,19 +4,26 @@ import numpy as np
 
 from functools import wraps
 
+# scalars and existing arrays flow through NumPy arithmetic as-is;
+# only containers (lists, tuples, ...) need coercion
+_PASSTHROUGH_TYPES = (int, float, np.ndarray, np.generic)
+
+
+def _asarray(value):
+    if isinstance(value, _PASSTHROUGH_TYPES):
+        return value
+    # force float64 contiguous so every downstream ufunc sees one dtype
+    # and a SIMD-friendly layout instead of mixed int/float broadcasts
+    return np.ascontiguousarray(value, dtype=np.float64)
+
 
 def convert_to_numpy(func):
     """Convert args and kwargs to numpy."""
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        new_args = [
-            np.array(arg) if not isinstance(arg, np.ndarray) else arg for arg in args
-        ]
-        new_kwargs = {
-            k: np.array(v) if not isinstance(v, np.ndarray) else v
-            for k, v in kwargs.items()
-        }
+        new_args = [_asarray(arg) for arg in args]
+        new_kwargs = {k: _asarray(v) for k, v in kwargs.items()}
         return func(*new_args, **new_kwargs)
 
     return wrapper
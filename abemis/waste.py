@@ -1,12 +1,34 @@
 """waste activity-based emissions equations."""
 
+import math
+
 import numpy as np
 
+from ._kernels import elementwise, fod_sum
 from .utils import convert_to_numpy
-from .constants import Conversions
+from .constants import (
+    C_TO_CO2,
+    CH4_TO_C,
+    G_TO_TONNE,
+    KG_TO_TONNE,
+    N_TO_N2O,
+    YEAR_TO_DAYS,
+    Conversions,
+)
 
 constants = Conversions()
 
+# flat conversion factors bound once at import, mirroring afolu/ippu
+_CH4_TO_C = CH4_TO_C
+_C_TO_CO2 = C_TO_CO2
+_G_TO_TONNE = G_TO_TONNE
+_KG_TO_TONNE = KG_TO_TONNE
+_N_TO_N2O = N_TO_N2O
+_YEAR_TO_DAYS = YEAR_TO_DAYS
+
+# compound factor for the indirect wastewater N2O equation
+_N2O_TAIL = _N_TO_N2O * _KG_TO_TONNE
+
 
 @convert_to_numpy
 def doc(A=0, B=0, C=0, D=0, E=0, F=0, *args, **kwargs):
@@ -56,31 +78,34 @@ def doc(A=0, B=0, C=0, D=0, E=0, F=0, *args, **kwargs):
     * Equation adapted from Equation 5.4 in [2]_
     * Fractions from table 2.4 in [3]_
     """  # noqa: E501
-    assert all(
-        0 <= v <= 1 for v in [A, B, C, D, E, F]
-    ), "All fractions should be between 0 and 1"
-
-    # DOC content in wet waste (table 2.4 in "2006 IPCC Guidelines ...")
-    # TODO: this could be moved to constants
-    frac = {
-        "food": 0.15,
-        "garden": 0.2,
-        "paper": 0.4,
-        "wood": 0.43,
-        "textiles": 0.24,
-        "industrial": 0.15,  # unsure where GPC gets this value
-    }
-
-    doc = (
-        (frac["food"] * A)
-        + (frac["garden"] * B)
-        + (frac["paper"] * C)
-        + (frac["wood"] * D)
-        + (frac["textiles"] * E)
-        + (frac["industrial"] * F)
+    stacked = np.stack(np.broadcast_arrays(A, B, C, D, E, F))
+    assert ((stacked >= 0) & (stacked <= 1)).all(), (
+        "All fractions should be between 0 and 1"
     )
 
-    return doc
+    if stacked.ndim == 1:
+        # scalar inputs: plain arithmetic, factoring the shared 0.15 weight
+        return 0.15 * (A + F) + 0.2 * B + 0.4 * C + 0.43 * D + 0.24 * E
+
+    # one BLAS pass over the stacked fractions instead of six scaled adds
+    return np.tensordot(_DOC_WEIGHTS, stacked, axes=1)
+
+
+# DOC content in wet waste (table 2.4 in "2006 IPCC Guidelines ...") in
+# the A..F argument order of doc(); the 0.15 for industrial waste is the
+# GPC value, though its source table is unclear
+_DOC_WEIGHTS = np.array([0.15, 0.2, 0.4, 0.43, 0.24, 0.15])
+
+
+# methane correction factor by management level (Equation 8.4 in GPC v7)
+_MCF_TABLE = {
+    "managed": 1,
+    "managed_well": 0.5,
+    "managed_poorly": 0.7,
+    "unmanaged_more5m": 0.8,
+    "unmanaged_less5m": 0.4,
+    "uncategorized": 0.6,
+}
 
 
 def _management_level_to_mcf(management_level: str, *args, **kwargs):
@@ -115,24 +140,34 @@ def _management_level_to_mcf(management_level: str, *args, **kwargs):
         Chapter 8: Waste. In `Global Protocol for Community-Scale Greenhouse Gas Emission Inventories <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=100>`__.
         WRI, C40, and ICLEI.
     """  # noqa: E501
-    dic = {
-        "managed": 1,
-        "managed_well": 0.5,
-        "managed_poorly": 0.7,
-        "unmanaged_more5m": 0.8,
-        "unmanaged_less5m": 0.4,
-        "uncategorized": 0.6,
-    }
+    if not isinstance(management_level, str):
+        return _mcf_vectorized(management_level)
 
-    mcf = dic.get(management_level.lower())
+    mcf = _MCF_TABLE.get(management_level.lower())
 
     if mcf is None:
-        raise Exception(f"Error: {management_level} not in {dic.keys()}")
+        raise Exception(f"Error: {management_level} not in {_MCF_TABLE.keys()}")
 
     return mcf
 
 
-@convert_to_numpy
+def _mcf_vectorized(levels):
+    """Methane correction factors for an array of management levels.
+
+    One hashed lookup per unique level plus a single gather, instead of a
+    Python-level dict lookup per element.
+    """
+    arr = np.char.lower(np.asarray(levels, dtype=str))
+    uniq, codes = np.unique(arr, return_inverse=True)
+
+    for level in uniq:
+        if level not in _MCF_TABLE:
+            raise Exception(f"Error: {level} not in {_MCF_TABLE.keys()}")
+
+    lut = np.array([_MCF_TABLE[level] for level in uniq])
+    return lut[codes]
+
+
 def methane_generation_potential(
     mcf, doc, docf: float = 0.6, f: float = 0.5, *args, **kwargs
 ):
@@ -185,8 +220,19 @@ def methane_generation_potential(
     ----------
     .. [1] Equation 8.4 in `GPC version 7 <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=100>`_
     """  # noqa: E501
-    CH4_TO_C = constants.CH4_to_C.value
-    return mcf * doc * docf * f * CH4_TO_C
+    # asarray on the first factor keeps list inputs broadcasting
+    return np.asarray(mcf) * doc * docf * f * _CH4_TO_C
+
+
+# oxidation factor by management level
+_OX_TABLE = {
+    "managed": 0.1,
+    "managed_well": 0.1,
+    "managed_poorly": 0.1,
+    "unmanaged_more5m": 0,
+    "unmanaged_less5m": 0,
+    "uncategorized": 0,
+}
 
 
 def _management_level_to_oxidation_factor(management_level: str, *args, **kwargs):
@@ -210,24 +256,19 @@ def _management_level_to_oxidation_factor(management_level: str, *args, **kwargs
         oxidation factor
         Units: dimensionless
     """  # noqa: E501
-    dic = {
-        "managed": 0.1,
-        "managed_well": 0.1,
-        "managed_poorly": 0.1,
-        "unmanaged_more5m": 0,
-        "unmanaged_less5m": 0,
-        "uncategorized": 0,
-    }
-
-    ox = dic.get(management_level.lower())
+    ox = _OX_TABLE.get(management_level.lower())
 
     if ox is None:
-        raise Exception(f"Error: {management_level} not in {dic.keys()}")
+        raise Exception(f"Error: {management_level} not in {_OX_TABLE.keys()}")
 
     return ox
 
 
-@convert_to_numpy
+@elementwise("f8(f8,f8,f8,f8)")
+def _methane_commitment(msw, lo, frec, ox):
+    return msw * lo * (1.0 - frec) * (1.0 - ox)
+
+
 def methane_commitment(msw, lo, frec, ox, *args, **kwargs):
     r"""Methane commitment (MC) estimate for solid waste sent to landfill.
 
@@ -279,7 +320,21 @@ def methane_commitment(msw, lo, frec, ox, *args, **kwargs):
     assert 0 <= frec <= 1, "frec must be between 0 and 1"
     assert 0 <= ox <= 1, "oxidation factor (ox) must be between 0 and 1"
 
-    return msw * lo * (1 - frec) * (1 - ox)
+    return _methane_commitment(msw, lo, frec, ox)
+
+
+# biological treatment emission factors (g gas / kg waste)
+# from Table 8.3 in GPC v7
+_BIO_TREATMENT_EF = {
+    "composting": {"ch4": {"dry": 10, "wet": 4}, "n2o": {"dry": 0.6, "wet": 0.24}},
+    "anaerobic_digestion": {
+        "ch4": {
+            "dry": 2,
+            "wet": 0.8,
+        },
+        "n2o": {"dry": None, "wet": None},
+    },
+}
 
 
 def _biological_treatment_ef(treatment, gas, wet_or_dry):
@@ -318,21 +373,14 @@ def _biological_treatment_ef(treatment, gas, wet_or_dry):
     assert gas in ["ch4", "n2o"], "gas must be either ch4 or n2o"
     assert wet_or_dry in ["wet", "dry"], "wet_or_dry must be either wet or dry"
 
-    efs = {
-        "composting": {"ch4": {"dry": 10, "wet": 4}, "n2o": {"dry": 0.6, "wet": 0.24}},
-        "anaerobic_digestion": {
-            "ch4": {
-                "dry": 2,
-                "wet": 0.8,
-            },
-            "n2o": {"dry": None, "wet": None},
-        },
-    }
+    return _BIO_TREATMENT_EF.get(treatment).get(gas).get(wet_or_dry)
 
-    return efs.get(treatment).get(gas).get(wet_or_dry)
+
+@elementwise("f8(f8,f8,f8,f8,f8,f8)")
+def _incineration_co2(m, wf, dm, cf, fcf, of):
+    return m * wf * dm * cf * fcf * of * _C_TO_CO2
 
 
-@convert_to_numpy
 def incineration_co2(m, wf, dm, cf, fcf, of):
     r"""non-biogenic CO2 emissions from incineration of waste.
 
@@ -368,12 +416,9 @@ def incineration_co2(m, wf, dm, cf, fcf, of):
     .. [1] `Equation 8.6 in GPC version 1 <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=102>`_
     """  # noqa: E501
     # TODO: add assertion that sum(WF) == 1
-    EF = wf * dm * cf * fcf * of
-    C_to_CO2 = constants.C_to_CO2.value
-    return m * EF * C_to_CO2
+    return _incineration_co2(m, wf, dm, cf, fcf, of)
 
 
-@convert_to_numpy
 def incineration_ch4(IW, EF):
     r"""CH4 emissions from incineration.
 
@@ -407,11 +452,10 @@ def incineration_ch4(IW, EF):
     ----------
     .. [1] `Equation 8.7 in GPC version 7 <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=103>`_
     """  # noqa: E501
-    g_to_tonnes = constants.g_to_tonne.value
-    return IW * EF * g_to_tonnes
+    # asarray on the first factor keeps list inputs broadcasting
+    return np.asarray(IW) * EF * _G_TO_TONNE
 
 
-@convert_to_numpy
 def incineration_n2o(IW, EF):
     r"""N2O emissions from incineration.
 
@@ -445,8 +489,81 @@ def incineration_n2o(IW, EF):
     ----------
     .. [1] `Equation 8.8 in GPC version 7 <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=105>`_
     """  # noqa: E501
-    g_to_tonnes = constants.g_to_tonne.value
-    return IW * EF * g_to_tonnes
+    # asarray on the first factor keeps list inputs broadcasting
+    return np.asarray(IW) * EF * _G_TO_TONNE
+
+
+@elementwise("f8(f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8,f8)")
+def _landfill_ch4(msw, A, B, C, D, E, F, mcf, docf, f, frec, ox):
+    doc_v = 0.15 * A + 0.2 * B + 0.4 * C + 0.43 * D + 0.24 * E + 0.15 * F
+    lo = mcf * doc_v * docf * f * _CH4_TO_C
+    return msw * lo * (1.0 - frec) * (1.0 - ox)
+
+
+@convert_to_numpy
+def landfill_ch4(
+    msw, A=0, B=0, C=0, D=0, E=0, F=0, mcf=1.0, docf=0.6, f=0.5, frec=0.0, ox=0.0
+):
+    r"""Methane commitment of landfilled waste, computed in one fused step.
+
+    Chains :func:`doc`, :func:`methane_generation_potential` and
+    :func:`methane_commitment` without materializing the intermediate
+    DOC and methane-generation-potential arrays, so array inputs make a
+    single pass over memory.
+
+    Parameters
+    ----------
+    msw : float
+        mass of solid waste sent to landfill, metric tonnes
+    A, B, C, D, E, F : float
+        waste-composition fractions, see :func:`doc`
+    mcf : float
+        methane correction factor, see
+        :func:`_management_level_to_mcf`, by default 1.0 (managed)
+    docf : float
+        fraction of DOC ultimately degraded, by default 0.6
+    f : float
+        fraction of methane in landfill gas, by default 0.5
+    frec : float
+        fraction of methane recovered at the landfill, by default 0.0
+    ox : float
+        oxidation factor, by default 0.0
+
+    Returns
+    -------
+    float
+        methane emissions
+        Units: tonnes CH4
+    """
+    return _landfill_ch4(msw, A, B, C, D, E, F, mcf, docf, f, frec, ox)
+
+
+def landfill_pipeline(columns):
+    r"""Landfill CH4 for a batch of sites held as parallel arrays.
+
+    Structure-of-arrays front end to :func:`landfill_ch4`: instead of
+    looping over sites in Python, pass one array per parameter and the
+    fused kernel runs once over the whole batch.
+
+    Parameters
+    ----------
+    columns : dict
+        mapping of :func:`landfill_ch4` parameter names
+        ("msw", "A", ..., "frec", "ox") to scalars or parallel
+        length-N arrays. Omitted parameters take the
+        :func:`landfill_ch4` defaults.
+
+    Returns
+    -------
+    np.ndarray
+        methane emissions per site
+        Units: tonnes CH4
+    """
+    columns = {
+        key: np.ascontiguousarray(value, dtype=np.float64)
+        for key, value in columns.items()
+    }
+    return landfill_ch4(**columns)
 
 
 @convert_to_numpy
@@ -489,25 +606,24 @@ def fod(msw, lo, r, ox, k, inventory_year):
     .. [1] `Equation 8.2 from GPC version 7 <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=99>`_
     .. [2] Based on `Equation 6 in CH4 emissions from solid waste disposal <https://www.ipcc-nggip.iges.or.jp/public/gp/bgp/5_1_CH4_Solid_Waste.pdf#page=5>`_
     """  # noqa: E501
-    if isinstance(msw, np.ndarray):
-        num_years = msw.size
-    elif isinstance(msw, (list, tuple)):
-        num_years = len(msw)
-    else:
-        msw_list = [msw]
-        num_years = len(msw_list)
+    if np.ndim(msw) == 0 and np.ndim(lo) == 0:
+        # single-year scalar history: the decay term is 1, so skip the
+        # array setup and ufunc dispatch entirely
+        sum_term = float(msw) * float(lo) * (1.0 - math.exp(-float(k)))
+        return (sum_term - r) * (1 - ox)
 
-    years = np.arange(inventory_year - num_years + 1, inventory_year + 1)
+    msw = np.atleast_1d(np.asarray(msw, dtype=np.float64))
 
-    exp_term = np.exp(-k * (inventory_year - years))
-    sum_term = np.sum(msw * lo * (1 - np.exp(-k)) * exp_term)
+    # the last element of msw is the inventory year itself, so the decay
+    # ages follow from position alone and the whole reduction runs in the
+    # fused (numba-compiled when available) kernel
+    sum_term = fod_sum(msw, lo, k)
 
     emissions = (sum_term - r) * (1 - ox)
 
     return emissions
 
 
-@convert_to_numpy
 def tow(p, bod, i):
     r"""Total organics in wastewater.
 
@@ -542,11 +658,14 @@ def tow(p, bod, i):
     ----------
     .. [1] `Equation 8.11 in GPC version 7 <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=108>`_
     """  # noqa: E501
-    days_in_year = constants.year_to_days
-    return p * bod * i * days_in_year
+    return np.asarray(p) * bod * i * _YEAR_TO_DAYS
+
+
+@elementwise("f8(f8,f8,f8,f8)")
+def _wastewater_ch4_ef(B, MCF, U, T):
+    return B * MCF * U * T
 
 
-@convert_to_numpy
 def wasterwater_ch4_ef(B, MCF, U, T):
     r"""Wastewater CH4 emissions factor.
 
@@ -583,11 +702,10 @@ def wasterwater_ch4_ef(B, MCF, U, T):
     ----------
     .. [1] `Equation 8.11 in GPC version 7 <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=108>`_
     """  # noqa: E501
-    return B * MCF * U * T
+    return _wastewater_ch4_ef(B, MCF, U, T)
 
 
-@convert_to_numpy
-def wastewater_ch4(tow, s, ef, r):
+def wastewater_ch4(tow, s, ef, r, out=None):
     r"""CH4 emissions from wastewater.
 
     .. math::
@@ -607,6 +725,10 @@ def wastewater_ch4(tow, s, ef, r):
         Organic component removed as sludge in inventory year, kg COD/yr or kg BOD/yr
     R : float
         Amount of CH4 recovered in inventory year, kg CH4/yr
+    out : np.ndarray, optional
+        preallocated array to write the result into, mirroring the
+        ufunc ``out=`` convention. Lets batch pipelines that call this
+        in a loop reuse one buffer instead of allocating per call.
 
     Returns
     -------
@@ -618,13 +740,18 @@ def wastewater_ch4(tow, s, ef, r):
     ----------
     .. [1] `Equation 8.9 in GPC version 7 <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=107>`_
     """  # noqa: E501
-    kg_to_tonnes = constants.kg_to_tonne.value
-    E_kg = (tow - s) * ef - r
-    E_tonnes = E_kg * kg_to_tonnes
-    return E_tonnes
+    if out is None:
+        E_kg = (np.asarray(tow) - s) * ef - r
+        return E_kg * _KG_TO_TONNE
+
+    # chain the ufuncs through the caller's buffer: no temporaries at all
+    np.subtract(tow, s, out=out)
+    np.multiply(out, ef, out=out)
+    np.subtract(out, r, out=out)
+    np.multiply(out, _KG_TO_TONNE, out=out)
+    return out
 
 
-@convert_to_numpy
 def wastewater_n2o_indirect(P, protein, Fnrp, Fnon, Find, N, EF):
     r"""Indirect N2O emissions from wastewater.
 
@@ -670,6 +797,4 @@ def wastewater_n2o_indirect(P, protein, Fnrp, Fnon, Find, N, EF):
     ----------
     .. [1] `Equation 8.12 in GPC version 7 <https://ghgprotocol.org/sites/default/files/standards/GPC_Full_MASTER_RW_v7.pdf#page=109>`_
     """  # noqa: E501
-    N_to_N2O = constants.N_to_N2O.value
-    kg_to_tonnes = constants.kg_to_tonne.value
-    return ((P * protein * Fnrp * Fnon * Find) - N) * EF * N_to_N2O * kg_to_tonnes
+    return ((np.asarray(P) * protein * Fnrp * Fnon * Find) - N) * EF * _N2O_TAIL
@@ -0,0 +1,30 @@
+"""Regression tests for the compiled kernels in abemis._kernels."""
+
+import numpy as np
+
+from abemis import _kernels, waste
+
+
+def test_fod_array_lo_matches_numpy_fallback():
+    # a per-year lo history reaches the compiled kernel as a read-only
+    # contiguous array; the pinned signatures must accept it
+    msw = [100.0, 110.0, 120.0]
+    lo = [0.05, 0.06, 0.07]
+    out = waste.fod(msw, lo, 1.0, 0.1, 0.05, 2020)
+    ref = _kernels._fod_sum_numpy(np.asarray(msw), np.asarray(lo), 0.05)
+    assert np.isclose(out, (ref - 1.0) * (1 - 0.1))
+
+
+def test_fod_accepts_readonly_inputs():
+    msw = np.array([100.0, 110.0, 120.0])
+    lo = np.array([0.05, 0.06, 0.07])
+    expected = waste.fod(msw.copy(), lo.copy(), 1.0, 0.1, 0.05, 2020)
+    msw.setflags(write=False)
+    lo.setflags(write=False)
+    assert np.isclose(waste.fod(msw, lo, 1.0, 0.1, 0.05, 2020), expected)
+
+
+def test_sum_prod3_accepts_readonly_inputs():
+    a = np.array([1.0, 2.0, 3.0])
+    a.setflags(write=False)
+    assert np.isclose(_kernels.sum_prod3(a, a, a), 36.0)